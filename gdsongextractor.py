@@ -7,64 +7,611 @@ import platform
 import webbrowser
 import random
 import time
+import subprocess
+import json
+import heapq
+import threading
+import signal
+import multiprocessing
+import argparse
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from bs4 import BeautifulSoup
-import mutagen
-from mutagen.easyid3 import EasyID3
+from mutagen.id3 import ID3, ID3NoHeaderError, TIT2, TPE1, TCON, TALB, TXXX
 from pathlib import Path
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QLabel, QVBoxLayout, QHBoxLayout,
                            QWidget, QPushButton, QProgressBar, QTextEdit, QListWidget,
                            QListWidgetItem, QCheckBox, QFileDialog, QGroupBox, QSplitter,
                            QLineEdit, QFrame)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QSize
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal, QSize, QPoint
 from PyQt6.QtGui import QPixmap, QIcon, QFont
 
 
-class FetchWorker(QThread):
-    """Worker thread for fetching metadata"""
-    progress_updated = pyqtSignal(int)
-    log_updated = pyqtSignal(str)
-    finished_with_songs = pyqtSignal(list)
+def parse_song_page(page, song_id, filename):
+    """Extract (title, artist, genre, note, login_walled) from a Newgrounds audio page.
+
+    Kept at module level so it can be shipped to a process pool; `note` is an
+    optional log message describing which fallback was used.
+    """
+    soup = BeautifulSoup(page, 'html.parser')
+    note = None
+
+    # Check if we're being redirected to login
+    login_walled = bool("Log in / Sign Up" in soup.text or soup.select_one(".login-header"))
+    if login_walled:
+        # Try a different approach - parse from the page title which often has "Title by Artist"
+        page_title = soup.title.string if soup.title else ""
+        artist = "Unknown Artist"
+        title = f"Unknown Song {song_id}"
+
+        # Title format is usually: "Song Title by Artist - Audio"
+        title_match = re.search(r'(.+) by (.+) - Audio', page_title)
+        if title_match:
+            title = title_match.group(1).strip()
+            artist = title_match.group(2).strip()
+            note = f"Using title extraction: {artist} - {title}"
+        else:
+            # Try with the URL directly - if the song exists, we should at least get the ID
+            # Improved fallback extraction using the song ID in the filename
+            note = f"Using fallback extraction for song {song_id}"
+            title = f"Song {song_id}"
+
+            # Try extracting from filename if it contains artist info
+            filename_without_ext = os.path.splitext(filename)[0]
+            if '-' in filename_without_ext:
+                parts = filename_without_ext.split('-', 1)
+                if len(parts) == 2:
+                     artist = parts[0].strip()
+                     title = parts[1].strip()
+    else:
+        # Extract title using multiple approaches
+        title = None
+
+        # Try different selectors for title
+        title_selectors = [
+            'h2.pod-header',
+            'h2.detail-title',
+            'h2.item-name',
+            '.pod-head h2',
+            '.audio-info h2',
+            'div.column-wide h2'
+        ]
 
-    def __init__(self, song_files, parent=None):
-        super().__init__(parent)
-        self.song_files = song_files
-        # List of user agents to rotate
-        self.user_agents = [
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.77 Safari/537.36',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Safari/605.1.15',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0',
-            'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.107 Safari/537.36'
+        for selector in title_selectors:
+            title_element = soup.select_one(selector)
+            if title_element and title_element.text.strip():
+                title = title_element.text.strip()
+                break
+
+        # If still no title, try page title approach
+        if not title:
+            page_title = soup.title.string if soup.title else ""
+            title_match = re.search(r'(.+) by .+ - Audio', page_title)
+            if title_match:
+                title = title_match.group(1).strip()
+
+        # Fallback
+        if not title:
+            title = f"Song {song_id}"
+
+        # Extract artist using a more targeted approach
+        artist = None
+
+        # Look for artist in author sections
+        artist_selectors = [
+            '.item-details a.item-author',
+            '.byline a',
+            'a.item-author',
+            '.pod-body .user-link',
+            'span.author a'
         ]
 
-    def run(self):
-        songs = []
-        total = len(self.song_files)
+        for selector in artist_selectors:
+            artist_elements = soup.select(selector)
+            for element in artist_elements:
+                text = element.text.strip()
+                # Skip if it's "Log in" or empty
+                if text and "Log in" not in text and len(text) > 1:
+                    artist = text
+                    break
+            if artist:
+                break
+
+        # Fallback for artist - try from page title
+        if not artist or "Log in" in artist:
+            page_title = soup.title.string if soup.title else ""
+            artist_match = re.search(r'.+ by (.+) - Audio', page_title)
+            if artist_match:
+                 artist = artist_match.group(1).strip()
+            else:
+                artist = "Unknown Artist"
 
-        for i, (song_id, filename) in enumerate(self.song_files):
-            metadata = self.fetch_song_metadata(song_id, filename)
-            if metadata:
-                 songs.append(metadata)
+    # Extract genre
+    genre_element = soup.select_one('dd.detail-genre')
+    genre = genre_element.text.strip() if genre_element and genre_element.text.strip() else "Electronic"
 
-            # Update progress
-            progress = int((i + 1) / total * 100)
-            self.progress_updated.emit(progress)
+    # Post-processing: Clean up artist name to ensure it's not "Log in"
+    if not artist or "Log in" in artist or len(artist) < 2:
+        artist = "Unknown Artist"
+
+    return title, artist, genre, note, login_walled
+
+
+def get_app_data_dir(log=print):
+    """Get (and create) the per-user folder GDSongExtractor keeps its cache files in"""
+    try:
+        if platform.system() == "Windows":
+            base = Path(os.environ.get('LOCALAPPDATA') or Path.home() / "AppData" / "Local")
+            data_dir = base / "GDSongExtractor"
+        elif platform.system() == "Darwin": # macOS
+            data_dir = Path.home() / "Library" / "Caches" / "GDSongExtractor"
+        else:
+            base = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / ".cache")
+            data_dir = base / "gdsongextractor"
+        data_dir.mkdir(parents=True, exist_ok=True)
+        return data_dir
+    except Exception as e:
+        log(f"Could not create cache folder: {e}")
+        return None
+
+
+def load_json_file(path, default, log=print):
+    """Load a JSON file, returning `default` if it is missing or unreadable"""
+    if not path or not path.exists():
+        return default
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        log(f"Ignoring unreadable file {path}: {e}")
+        return default
+
+
+def save_json_file(path, data, log=print, **json_options):
+    """Write a JSON file, logging instead of raising on failure. Returns True if saved."""
+    if not path:
+        return False
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, **json_options)
+        return True
+    except Exception as e:
+        log(f"Could not save {path}: {e}")
+        return False
+
+
+class NegativeCache:
+    """Remembers failed song lookups so known-dead IDs are skipped on later scans"""
+
+    # How long each kind of failure is trusted before the song is tried again (seconds)
+    EXPIRY = {
+        'removed': 30 * 24 * 3600,
+        'login_walled': 7 * 24 * 3600,
+        'parse_failed': 24 * 3600,
+        'http_error': 3600
+    }
+
+    # Failures that say nothing about the song itself: retried and reported, never cached
+    TRANSIENT = ('rate_limited', 'network_error')
+
+    LABELS = {
+        'removed': "Removed or not found on Newgrounds",
+        'login_walled': "Login-walled (fallback metadata used)",
+        'rate_limited': "Rate limited",
+        'parse_failed': "Page could not be parsed",
+        'network_error': "Network error",
+        'http_error': "Other HTTP error"
+    }
+
+    def __init__(self, path=None, log=print):
+        self.path = path
+        # Used from the thread that created the cache; worker threads pass their own to save()
+        self.log = log
+        self.entries = {}
+        self.lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """Load entries from disk, ignoring a missing or corrupt file"""
+        self.entries = load_json_file(self.path, {}, self.log)
+
+    def save(self, log=None):
+        """Write entries to disk, dropping expired ones"""
+        if not self.path:
+            return
+        with self.lock:
+            now = time.time()
+            self.entries = {
+                song_id: entry for song_id, entry in self.entries.items()
+                if now - entry['time'] < self.EXPIRY.get(entry['reason'], 0)
+            }
+            save_json_file(self.path, self.entries, log or self.log)
+
+    def get(self, song_id):
+        """Return the unexpired failure entry for a song, or None"""
+        with self.lock:
+            entry = self.entries.get(str(song_id))
+            if entry and time.time() - entry['time'] < self.EXPIRY.get(entry['reason'], 0):
+                return entry
+            return None
 
-            # Variable delay to avoid rate limiting and detection
-            time.sleep(random.uniform(1.0, 2.5))
+    def record(self, song_id, reason, detail="", metadata=None):
+        """Remember that a song failed for the given reason"""
+        with self.lock:
+            self.entries[str(song_id)] = {
+                'reason': reason,
+                'detail': detail,
+                'time': time.time(),
+                'metadata': metadata
+            }
 
-        self.finished_with_songs.emit(songs)
+    def forget(self, song_id):
+        """Drop a song's entry (e.g. after it was fetched successfully)"""
+        with self.lock:
+            self.entries.pop(str(song_id), None)
+
+    def clear(self):
+        """Forget every failure"""
+        with self.lock:
+            self.entries = {}
+        self.save()
+
+
+def detect_gd_songs_path(log=print):
+    """Get the path to Geometry Dash songs folder based on OS"""
+    gd_path = None
+    try:
+        if platform.system() == "Windows":
+             username = os.environ.get('USERNAME') or os.environ.get('USER')
+             # Use LOCALAPPDATA environment variable for robustness
+             local_app_data = os.environ.get('LOCALAPPDATA')
+             if local_app_data:
+                 gd_path = Path(local_app_data) / "GeometryDash"
+             elif username: # Fallback to constructed path
+                 gd_path = Path(f"C:/Users/{username}/AppData/Local/GeometryDash")
+
+        elif platform.system() == "Linux":
+            username = os.environ.get('USER')
+            # Common Wine path, check if ~/.wine exists first
+            wine_path = Path.home() / ".wine" # Use Path.home()
+            if wine_path.exists() and username:
+                # Check for potential Proton path first if Steam directory exists
+                steam_path = Path.home() / ".steam" / "steam" / "steamapps" / "compatdata" / "322170" / "pfx"
+                proton_gd_path = None
+                if steam_path.exists():
+                     # Standard Proton user might be steamuser
+                     steam_user_path = steam_path / "drive_c" / "users" / "steamuser" / "AppData" / "Local" / "GeometryDash"
+                     if steam_user_path.exists():
+                          proton_gd_path = steam_user_path
+                     else:
+                          # Fallback to current username within proton prefix (less common)
+                          user_proton_path = steam_path / "drive_c" / "users" / username / "AppData" / "Local" / "GeometryDash"
+                          if user_proton_path.exists():
+                               proton_gd_path = user_proton_path
+
+                if proton_gd_path:
+                     gd_path = proton_gd_path
+                     log("Detected Steam Play (Proton) Geometry Dash path.")
+                else:
+                    # Fallback to standard Wine path
+                    wine_gd_path = wine_path / f"drive_c/users/{username}/AppData/Local/GeometryDash"
+                    if wine_gd_path.exists():
+                         gd_path = wine_gd_path
+                         log("Detected standard Wine Geometry Dash path.")
+
+        elif platform.system() == "Darwin": # macOS
+             username = os.environ.get('USER')
+             if username:
+                 # Default path for GD on macOS
+                 mac_path = Path.home() / "Library" / "Application Support" / "GeometryDash"
+                 if mac_path.exists():
+                      gd_path = mac_path
+
+        else:
+            log(f"Unsupported operating system: {platform.system()}")
+            return None
+
+        if gd_path and not gd_path.exists():
+             log(f"Potential Geometry Dash path found but does not exist: {gd_path}")
+             return None
+        elif not gd_path:
+             log("Could not determine Geometry Dash path.")
+             return None
+
+    except Exception as e:
+        log(f"Error determining Geometry Dash path: {e}")
+        return None
+
+    log(f"Found Geometry Dash path: {gd_path}")
+    return gd_path
+
+
+def detect_music_folder_path(log=print):
+    """Get the path to the user's Music folder"""
+    music_path = None
+    try:
+        if platform.system() == "Windows":
+            # Use SHGetKnownFolderPath for robustness (requires ctypes/comtypes, fallback if unavailable)
+            try:
+                import ctypes
+                from ctypes import wintypes, windll
+
+                FOLDERID_Music = ctypes.GUID('{4BD8D571-6D19-48D3-BE97-422220080E43}')
+                SHGetKnownFolderPath = windll.shell32.SHGetKnownFolderPath
+                SHGetKnownFolderPath.argtypes = [
+                    ctypes.POINTER(ctypes.GUID), wintypes.DWORD,
+                    wintypes.HANDLE, ctypes.POINTER(wintypes.LPWSTR)
+                ]
+                SHGetKnownFolderPath.restype = ctypes.HRESULT
+
+                path_ptr = wintypes.LPWSTR()
+                if SHGetKnownFolderPath(ctypes.byref(FOLDERID_Music), 0, None, ctypes.byref(path_ptr)) == 0: # S_OK
+                     music_path = Path(path_ptr.value)
+                     ctypes.windll.ole32.CoTaskMemFree(path_ptr) # Free memory
+                else: # Fallback if API call fails
+                     raise OSError("SHGetKnownFolderPath failed")
+
+            except Exception:
+                 # Fallback if ctypes fails or on minimal systems
+                 username = os.environ.get('USERNAME') or os.environ.get('USER')
+                 if username:
+                    user_profile = os.environ.get('USERPROFILE')
+                    if user_profile:
+                         music_path = Path(user_profile) / "Music"
+                    else: # Absolute fallback
+                         music_path = Path(f"C:/Users/{username}/Music")
+
+        elif platform.system() == "Linux":
+            username = os.environ.get('USER')
+            if username:
+                 # Check XDG user directory config first
+                 try:
+                     # Use subprocess to call xdg-user-dir for reliability
+                     result = subprocess.run(['xdg-user-dir', 'MUSIC'], capture_output=True, text=True, check=True)
+                     xdg_music_dir = result.stdout.strip()
+                     if xdg_music_dir and Path(xdg_music_dir).is_dir():
+                         music_path = Path(xdg_music_dir)
+                     else: # Fallback to default if xdg-user-dir gives bad path or isn't set
+                         music_path = Path.home() / "Music"
+                 except (FileNotFoundError, subprocess.CalledProcessError): # If xdg-user-dir command fails
+                     music_path = Path.home() / "Music"
+
+        elif platform.system() == "Darwin": # macOS
+            music_path = Path.home() / "Music"
+
+        else:
+             log(f"Cannot determine Music folder for OS: {platform.system()}")
+             return None
+
+        # Create the directory if it doesn't exist and we found a path
+        if music_path and not music_path.exists():
+            try:
+                music_path.mkdir(parents=True, exist_ok=True)
+                log(f"Created Music folder: {music_path}")
+            except Exception as e:
+                 log(f"Error creating Music folder {music_path}: {e}")
+                 return None # Failed to create
+
+    except Exception as e:
+         log(f"Error determining Music folder path: {e}")
+         return None
+
+    if music_path:
+         log(f"Using Music folder: {music_path}")
+    else:
+         log("Could not determine Music folder path.")
+
+    return music_path
+
+
+# Manifest kept in the music folder mapping copied files back to song IDs
+MANIFEST_FILENAME = ".gdsongextractor_manifest.json"
+# TXXX descriptions used to store the Newgrounds source in copied files
+NEWGROUNDS_ID_TAG = "Newgrounds ID"
+NEWGROUNDS_URL_TAG = "Newgrounds URL"
+
+
+def song_id3_frames(song):
+    """Build the ID3 frames GDSongExtractor writes for a song, keyed by HashKey"""
+    frames = [
+        TIT2(encoding=3, text=song['title']),
+        TPE1(encoding=3, text=song['artist']),
+        TCON(encoding=3, text=song['genre']),
+        TALB(encoding=3, text="Geometry Dash"),
+        TXXX(encoding=3, desc=NEWGROUNDS_ID_TAG, text=str(song['id'])),
+        TXXX(encoding=3, desc=NEWGROUNDS_URL_TAG, text=song['url'])
+    ]
+    # Empty frames are dropped on save, so writing them would make every refresh look like a change
+    return {frame.HashKey: frame for frame in frames if frame.text and frame.text[0]}
+
+
+def write_song_tags(path, song):
+    """Write a song's ID3 frames, touching only those that changed. Returns True if saved."""
+    try:
+        tags = ID3(path)
+    except ID3NoHeaderError:
+        # If there's no ID3 tag, add one
+        tags = ID3()
+
+    changed = False
+    for key, frame in song_id3_frames(song).items():
+        existing = tags.get(key)
+        if existing is None or [str(text) for text in existing.text] != frame.text:
+            tags[key] = frame
+            changed = True
+
+    # Only the tag block is rewritten; the audio stays in place when the padding fits
+    if changed:
+        tags.save(path)
+    return changed
+
+
+def safe_song_filename(song):
+    """Build the 'Artist - Title.mp3' filename songs are copied to"""
+    safe_filename = f"{song['artist']} - {song['title']}.mp3"
+    return re.sub(r'[\\/*?:"<>|]', '_', safe_filename)  # Remove illegal characters
+
+
+def read_song_tags(path):
+    """Read (song ID, title, artist, album) from a file's tags; any of them may be None"""
+    try:
+        tags = ID3(path)
+    except Exception:
+        return None, None, None, None
+
+    song_id = None
+    frames = tags.getall(f"TXXX:{NEWGROUNDS_ID_TAG}")
+    if frames and str(frames[0].text[0]).isdigit():
+        song_id = int(frames[0].text[0])
+    title = str(tags['TIT2'].text[0]) if 'TIT2' in tags and tags['TIT2'].text else None
+    artist = str(tags['TPE1'].text[0]) if 'TPE1' in tags and tags['TPE1'].text else None
+    album = str(tags['TALB'].text[0]) if 'TALB' in tags and tags['TALB'].text else None
+    return song_id, title, artist, album
+
+
+def load_manifest(music_path, log=print):
+    """Load the {relative filename: song ID} manifest from the music folder"""
+    return load_json_file(music_path / MANIFEST_FILENAME, {}, log)
+
+
+def save_manifest(music_path, manifest, log=print):
+    """Write the {relative filename: song ID} manifest to the music folder. Returns True if saved."""
+    return save_json_file(music_path / MANIFEST_FILENAME, manifest, log, indent=1, sort_keys=True)
+
+
+def _warm_parse_worker():
+    """Pay the bs4/html.parser import cost up front inside a pool process"""
+    BeautifulSoup("<html><title>warm</title></html>", 'html.parser')
+    return os.getpid()
+
+
+def create_parse_pool(workers=1):
+    """Create a process pool for page parsing and start its workers.
+
+    Fetches are rate limited and sequential, so only one page is ever parsed at a
+    time; the default single worker just keeps html.parser off the GUI's GIL.
+    """
+    # Always spawn: forking a running Qt process with other threads alive can deadlock the children
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+    # Submit one warm-up job per worker so interpreter start-up and the bs4 import happen before the first scan
+    for _ in range(workers):
+        pool.submit(_warm_parse_worker)
+    return pool
+
+
+class NewgroundsResolver:
+    """Resolves song IDs to metadata by scraping Newgrounds (no Qt, shared by the GUI, CLI and server)"""
+
+    # List of user agents to rotate
+    USER_AGENTS = [
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.77 Safari/537.36',
+        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Safari/605.1.15',
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0',
+        'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.107 Safari/537.36'
+    ]
+
+    def __init__(self, parse_pool=None, negative_cache=None, log=print):
+        # Optional process pool for HTML parsing (None = parse in the calling thread)
+        self.parse_pool = parse_pool
+        self.negative_cache = negative_cache if negative_cache is not None else NegativeCache()
+        self.log = log
+        # Variable delay between requests to avoid rate limiting and detection
+        self.rate_lock = threading.Lock()
+        self.next_request_time = 0.0
+        # Seconds to pause after the next 429/503; doubles while Newgrounds keeps throttling
+        self.backoff = 30.0
+
+    # Pause after a connection error before trying Newgrounds again (seconds)
+    NETWORK_ERROR_PAUSE = 10
+    # Longest pause back_off() will ask for without a Retry-After header (seconds)
+    MAX_BACKOFF = 15 * 60
+
+    def wait_for_turn(self):
+        """Block until the next Newgrounds request is allowed (thread-safe)"""
+        while True:
+            # Sleep outside the lock so back_off()/pause() can still push the deadline out;
+            # the slot is only claimed once the deadline has passed on a re-check
+            with self.rate_lock:
+                delay = self.next_request_time - time.monotonic()
+                if delay <= 0:
+                    self.next_request_time = time.monotonic() + random.uniform(1.0, 2.5)
+                    return
+            time.sleep(delay)
+
+    def pause(self, delay):
+        """Hold back every request for at least `delay` seconds"""
+        with self.rate_lock:
+            self.next_request_time = max(self.next_request_time, time.monotonic() + delay)
+
+    def back_off(self, response):
+        """Pause all requests after Newgrounds signals rate limiting"""
+        retry_after = response.headers.get('Retry-After', '') if response.headers else ''
+        with self.rate_lock:
+            delay = float(retry_after) if retry_after.isdigit() else self.backoff
+            self.backoff = min(self.backoff * 2, self.MAX_BACKOFF)
+        self.pause(delay)
+        self.log(f"Newgrounds is rate limiting requests, pausing for {delay:.0f} seconds")
+
+    def resolve(self, song_id, filename):
+        """Return (metadata, failure_reason) for a song, skipping known failures.
+
+        Either value may be None; login-walled songs return both fallback
+        metadata and the 'login_walled' reason.
+        """
+        # Skip songs that recently failed instead of paying for another request
+        cached_failure = self.negative_cache.get(song_id)
+        if cached_failure:
+            metadata = cached_failure.get('metadata')
+            if metadata:
+                metadata = dict(metadata, filename=filename)
+                self.log(f"Using cached fallback metadata for song ID {song_id}")
+            else:
+                self.log(f"Skipping song ID {song_id} (known failure: {cached_failure['reason']})")
+            return metadata, cached_failure['reason']
+
+        # Throttling and connection errors aren't about this song, so try once more after the pause
+        for attempt in range(2):
+            self.wait_for_turn()
+            metadata, failure = self.fetch_song_metadata(song_id, filename)
+            if failure not in NegativeCache.TRANSIENT:
+                break
+        return metadata, failure
+
+    # Songs are fetched one at a time anyway, so take one per batch and let
+    # re-prioritised songs jump the queue straight away
+    BATCH_SIZE = 1
+
+    def resolve_many(self, song_files):
+        """Resolve songs in order. Returns {song_id: (metadata, failure_reason)}"""
+        return {song_id: self.resolve(song_id, filename) for song_id, filename in song_files}
+
+    def save(self):
+        """Persist the negative cache"""
+        self.negative_cache.save(self.log)
+
+    def parse_page(self, page, song_id, filename):
+        """Parse a page in the process pool if available, otherwise in this thread"""
+        parse_pool = self.parse_pool
+        if parse_pool is not None:
+            try:
+                # Parse in a worker process so html.parser doesn't hold the GIL
+                return parse_pool.submit(parse_song_page, page, song_id, filename).result()
+            except RuntimeError:
+                # Pool was shut down mid-scan (option toggled off)
+                self.parse_pool = None
+        return parse_song_page(page, song_id, filename)
 
     def fetch_song_metadata(self, song_id, filename):
-        """Fetch song metadata from Newgrounds"""
+        """Fetch song metadata from Newgrounds, returning (metadata, failure_reason)"""
         url = f"https://www.newgrounds.com/audio/listen/{song_id}"
 
         try:
-            self.log_updated.emit(f"Fetching metadata for song ID {song_id}...")
+            self.log(f"Fetching metadata for song ID {song_id}...")
 
             # Use a rotating user agent
             headers = {
-                'User-Agent': random.choice(self.user_agents),
+                'User-Agent': random.choice(self.USER_AGENTS),
                 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
                 'Accept-Language': 'en-US,en;q=0.5',
                 'DNT': '1',
@@ -75,124 +622,429 @@ class FetchWorker(QThread):
             }
 
             response = requests.get(url, headers=headers)
+        except requests.RequestException as e:
+            self.log(f"Error fetching metadata for song ID {song_id}: {e}")
+            self.pause(self.NETWORK_ERROR_PAUSE)
+            return None, 'network_error'
+
+        if response.status_code != 200:
+            self.log(f"Failed to fetch metadata for song ID {song_id} (Status code: {response.status_code})")
+            if response.status_code in (404, 410):
+                reason = 'removed'
+            elif response.status_code in (429, 503):
+                # Throttling is about us, not the song: pause everything and don't cache the ID
+                self.back_off(response)
+                return None, 'rate_limited'
+            else:
+                reason = 'http_error'
+            self.negative_cache.record(song_id, reason, f"HTTP {response.status_code}")
+            return None, reason
 
-            if response.status_code != 200:
-                self.log_updated.emit(f"Failed to fetch metadata for song ID {song_id} (Status code: {response.status_code})")
-                return None
+        # Not throttled any more, so the next 429 starts from a short pause again
+        with self.rate_lock:
+            self.backoff = 30.0
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+        try:
+            title, artist, genre, note, login_walled = self.parse_page(response.content, song_id, filename)
+        except Exception as e:
+            self.log(f"Error parsing metadata for song ID {song_id}: {e}")
+            self.negative_cache.record(song_id, 'parse_failed', str(e))
+            return None, 'parse_failed'
+
+        if note:
+            self.log(note)
+
+        self.log(f"Found: {artist} - {title}")
+
+        metadata = {
+            'id': song_id,
+            'title': title,
+            'artist': artist,
+            'genre': genre,
+            'filename': filename,
+            'url': url
+        }
+
+        if login_walled:
+            # Keep the fallback result so the login-wall path isn't re-run every scan
+            self.negative_cache.record(song_id, 'login_walled', metadata=metadata)
+            return metadata, 'login_walled'
+
+        self.negative_cache.forget(song_id)
+        return metadata, None
+
+
+class RemoteResolver:
+    """Resolves song IDs through a running GDSongExtractor server instead of scraping directly"""
+
+    # The server fetches uncached IDs one at a time behind its rate limiter, so keep
+    # each request small and allow it time proportional to its size, on top of the
+    # longest pause the server may be sitting out after Newgrounds throttles it
+    BATCH_SIZE = 25
+    SECONDS_PER_SONG = 10
+    CONNECT_TIMEOUT = 10
+
+    def __init__(self, server_url, log=print):
+        self.server_url = server_url.rstrip('/')
+        self.log = log
+
+    def resolve(self, song_id, filename):
+        """Return (metadata, failure_reason) for a song, like NewgroundsResolver.resolve"""
+        return self.resolve_many([(song_id, filename)]).get(song_id, (None, 'network_error'))
+
+    def resolve_many(self, song_files):
+        """Look up many songs in batched requests. Returns {song_id: (metadata, failure_reason)}"""
+        results = {}
+        for start in range(0, len(song_files), self.BATCH_SIZE):
+            results.update(self.resolve_batch(song_files[start:start + self.BATCH_SIZE]))
+        return results
+
+    def resolve_batch(self, song_files):
+        """Look up one batch of songs in a single request"""
+        payload = {'songs': [{'id': song_id, 'filename': filename} for song_id, filename in song_files]}
+        read_timeout = NewgroundsResolver.MAX_BACKOFF + 60 + self.SECONDS_PER_SONG * len(song_files)
+        timeout = (self.CONNECT_TIMEOUT, read_timeout)
+        try:
+            response = requests.post(f"{self.server_url}/songs", json=payload, timeout=timeout)
+            response.raise_for_status()
+            data = response.json()
+            songs, failures = data['songs'], data['failures']
+
+            results = {}
+            for song_id, filename in song_files:
+                metadata = songs.get(str(song_id))
+                if metadata:
+                    # The server doesn't know our local filename
+                    metadata = dict(metadata, filename=filename)
+                    self.log(f"Found: {metadata['artist']} - {metadata['title']}")
+                results[song_id] = (metadata, failures.get(str(song_id)))
+            return results
+        except (requests.RequestException, ValueError, KeyError, TypeError, AttributeError) as e:
+            self.log(f"Error contacting metadata server {self.server_url}: {e}")
+            return {song_id: (None, 'network_error') for song_id, _ in song_files}
+
+    def save(self):
+        """Nothing to persist locally; the server keeps the caches"""
+
+
+class MetadataServer:
+    """Shared metadata resolver with a cache and request coalescing, served over HTTP/JSON"""
+
+    # How long successful lookups are served from the cache (seconds)
+    CACHE_TTL = 7 * 24 * 3600
+
+    def __init__(self, resolver, cache_path=None):
+        self.resolver = resolver
+        self.cache_path = cache_path
+        # str(song_id) -> {'time', 'metadata', 'failure'}
+        self.cache = load_json_file(cache_path, {})
+        # song_id -> Future for lookups currently being fetched upstream
+        self.in_flight = {}
+        self.lock = threading.Lock()
+        # Set when an upstream fetch changed either cache since the last save
+        self.dirty = False
+        self.save_lock = threading.Lock()
+
+    def lookup(self, song_id, filename=None):
+        """Return (metadata, failure_reason), fetching upstream at most once per ID at a time"""
+        filename = filename or f"{song_id}.mp3"
+        with self.lock:
+            entry = self.cache.get(str(song_id))
+            if entry and time.time() - entry['time'] < self.CACHE_TTL:
+                return entry['metadata'], entry['failure']
+
+            # Concurrent lookups of the same ID wait on the first one's result
+            future = self.in_flight.get(song_id)
+            owner = future is None
+            if owner:
+                future = Future()
+                self.in_flight[song_id] = future
+
+        if not owner:
+            return future.result()
 
-            # Check if we're being redirected to login
-            if "Log in / Sign Up" in soup.text or soup.select_one(".login-header"):
-                # Try a different approach - parse from the page title which often has "Title by Artist"
-                page_title = soup.title.string if soup.title else ""
-                artist = "Unknown Artist"
-                title = f"Unknown Song {song_id}"
-
-                # Title format is usually: "Song Title by Artist - Audio"
-                title_match = re.search(r'(.+) by (.+) - Audio', page_title)
-                if title_match:
-                    title = title_match.group(1).strip()
-                    artist = title_match.group(2).strip()
-                    self.log_updated.emit(f"Using title extraction: {artist} - {title}")
-                else:
-                    # Try with the URL directly - if the song exists, we should at least get the ID
-                    # Improved fallback extraction using the song ID in the filename
-                    self.log_updated.emit(f"Using fallback extraction for song {song_id}")
-                    title = f"Song {song_id}"
-
-                    # Try extracting from filename if it contains artist info
-                    filename_without_ext = os.path.splitext(filename)[0]
-                    if '-' in filename_without_ext:
-                        parts = filename_without_ext.split('-', 1)
-                        if len(parts) == 2:
-                             artist = parts[0].strip()
-                             title = parts[1].strip()
-            else:
-                # Extract title using multiple approaches
-                title = None
-
-                # Try different selectors for title
-                title_selectors = [
-                    'h2.pod-header',
-                    'h2.detail-title',
-                    'h2.item-name',
-                    '.pod-head h2',
-                    '.audio-info h2',
-                    'div.column-wide h2'
-                ]
+        try:
+            # The resolver applies the negative cache and rate limiting
+            metadata, failure = self.resolver.resolve(song_id, filename)
+            with self.lock:
+                if metadata:
+                    self.cache[str(song_id)] = {'time': time.time(), 'metadata': metadata, 'failure': failure}
+                self.dirty = True
+            future.set_result((metadata, failure))
+            return metadata, failure
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self.lock:
+                self.in_flight.pop(song_id, None)
+
+    def lookup_many(self, songs):
+        """Resolve a batch of (song_id, filename) pairs into the JSON response shape"""
+        result = {'songs': {}, 'failures': {}}
+        for song_id, filename in songs:
+            metadata, failure = self.lookup(song_id, filename)
+            if metadata:
+                result['songs'][str(song_id)] = metadata
+            if failure:
+                result['failures'][str(song_id)] = failure
+        return result
+
+    def save(self):
+        """Persist the metadata and negative caches, dropping expired entries"""
+        # Handler threads may save concurrently; only one writes the files at a time
+        with self.save_lock:
+            with self.lock:
+                now = time.time()
+                self.cache = {
+                    song_id: entry for song_id, entry in self.cache.items()
+                    if now - entry['time'] < self.CACHE_TTL
+                }
+                cache = dict(self.cache)
+                self.dirty = False
+            save_json_file(self.cache_path, cache)
+            self.resolver.save()
+
+    def save_if_dirty(self):
+        """Persist the caches after a request that fetched anything upstream"""
+        if self.dirty:
+            self.save()
+
+    def serve(self, host, port):
+        """Run the HTTP API until interrupted or terminated"""
+        handler = type('Handler', (MetadataRequestHandler,), {'metadata_server': self})
+        httpd = ThreadingHTTPServer((host, port), handler)
+        print(f"GDSongExtractor metadata server listening on http://{host}:{port}")
+
+        if threading.current_thread() is threading.main_thread():
+            # shutdown() waits for serve_forever() to return, so it can't run in the handler itself
+            signal.signal(signal.SIGTERM,
+                          lambda signum, frame: threading.Thread(target=httpd.shutdown, daemon=True).start())
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            httpd.server_close()
+            self.save()
+
+
+class MetadataRequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler for MetadataServer.
+
+    GET  /songs/<id>  -> {"song": {...} | null, "failure": "<reason>" | null}
+    POST /songs       <- {"ids": [1, 2]} or {"songs": [{"id": 1, "filename": "1.mp3"}]}
+                      -> {"songs": {"1": {...}}, "failures": {"2": "removed"}}
+    """
+    metadata_server = None
+
+    # Every uncached ID costs an upstream request, so refuse oversized batches outright
+    MAX_BATCH = 100
+    MAX_BODY_BYTES = 64 * 1024
+
+    def send_json(self, status, data):
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        match = re.fullmatch(r'/songs/(\d+)', self.path)
+        if self.path == '/health':
+            self.send_json(200, {'status': 'ok', 'cached': len(self.metadata_server.cache)})
+        elif match:
+            metadata, failure = self.metadata_server.lookup(int(match.group(1)))
+            self.send_json(200, {'song': metadata, 'failure': failure})
+            self.metadata_server.save_if_dirty()
+        else:
+            self.send_json(404, {'error': 'not found'})
 
-                for selector in title_selectors:
-                    title_element = soup.select_one(selector)
-                    if title_element and title_element.text.strip():
-                        title = title_element.text.strip()
-                        break
-
-                # If still no title, try page title approach
-                if not title:
-                    page_title = soup.title.string if soup.title else ""
-                    title_match = re.search(r'(.+) by .+ - Audio', page_title)
-                    if title_match:
-                        title = title_match.group(1).strip()
-
-                # Fallback
-                if not title:
-                    title = f"Song {song_id}"
-
-                # Extract artist using a more targeted approach
-                artist = None
-
-                # Look for artist in author sections
-                artist_selectors = [
-                    '.item-details a.item-author',
-                    '.byline a',
-                    'a.item-author',
-                    '.pod-body .user-link',
-                    'span.author a'
-                ]
+    def do_POST(self):
+        if self.path != '/songs':
+            self.send_json(404, {'error': 'not found'})
+            return
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            if length > self.MAX_BODY_BYTES:
+                self.send_json(413, {'error': f"request body over {self.MAX_BODY_BYTES} bytes"})
+                return
+            if length < 0:
+                raise ValueError("negative Content-Length")
+            request = json.loads(self.rfile.read(length) or b'{}')
+            ids, song_entries = request.get('ids', []), request.get('songs', [])
+            # A string would otherwise be iterated character by character
+            if not isinstance(ids, list) or not isinstance(song_entries, list):
+                raise TypeError("'ids' and 'songs' must be lists")
+            songs = [(int(song_id), None) for song_id in ids]
+            songs += [(int(song['id']), song.get('filename')) for song in song_entries]
+        except (ValueError, TypeError, KeyError, AttributeError) as e:
+            self.send_json(400, {'error': f"bad request: {e}"})
+            return
+        if len(songs) > self.MAX_BATCH:
+            self.send_json(413, {'error': f"more than {self.MAX_BATCH} songs in one request"})
+            return
+        self.send_json(200, self.metadata_server.lookup_many(songs))
+        self.metadata_server.save_if_dirty()
 
-                for selector in artist_selectors:
-                    artist_elements = soup.select(selector)
-                    for element in artist_elements:
-                        text = element.text.strip()
-                        # Skip if it's "Log in" or empty
-                        if text and "Log in" not in text and len(text) > 1:
-                            artist = text
-                            break
-                    if artist:
-                        break
-
-                # Fallback for artist - try from page title
-                if not artist or "Log in" in artist:
-                    page_title = soup.title.string if soup.title else ""
-                    artist_match = re.search(r'.+ by (.+) - Audio', page_title)
-                    if artist_match:
-                         artist = artist_match.group(1).strip()
-                    else:
-                        artist = "Unknown Artist"
+    def log_message(self, format, *args):
+        print(f"[server] {self.address_string()} {format % args}")
 
-            # Extract genre
-            genre_element = soup.select_one('dd.detail-genre')
-            genre = genre_element.text.strip() if genre_element and genre_element.text.strip() else "Electronic"
 
-            # Post-processing: Clean up artist name to ensure it's not "Log in"
-            if not artist or "Log in" in artist or len(artist) < 2:
-                artist = "Unknown Artist"
+class FetchWorker(QThread):
+    """Worker thread for fetching metadata"""
+    progress_updated = pyqtSignal(int)
+    log_updated = pyqtSignal(str)
+    song_fetched = pyqtSignal(dict)
+    finished_with_songs = pyqtSignal(list)
 
-            self.log_updated.emit(f"Found: {artist} - {title}")
+    # Lower values are fetched first
+    PRIORITY_SELECTED = 0
+    PRIORITY_VISIBLE = 1
+    PRIORITY_NORMAL = 2
 
-            return {
-                'id': song_id,
-                'title': title,
-                'artist': artist,
-                'genre': genre,
-                'filename': filename,
-                'url': url
-            }
+    def __init__(self, song_files, parse_pool=None, negative_cache=None, server_url=None, parent=None):
+        super().__init__(parent)
+        self.song_files = song_files
+        # Scrape Newgrounds directly, or ask a shared metadata server if one is configured
+        if server_url:
+            self.resolver = RemoteResolver(server_url, log=self.log_updated.emit)
+        else:
+            self.resolver = NewgroundsResolver(parse_pool, negative_cache, log=self.log_updated.emit)
+        # song_id -> failure reason for this scan, for the failure report
+        self.failures = {}
+
+        # Priority queue of (priority, sequence, song_id, filename). Re-prioritised
+        # songs are pushed again; stale entries are skipped when popped.
+        self._queue_lock = threading.Lock()
+        self._queue = [(self.PRIORITY_NORMAL, i, song_id, filename)
+                       for i, (song_id, filename) in enumerate(song_files)]
+        heapq.heapify(self._queue)
+        self._sequence = len(self._queue)
+        self._pending = dict(song_files)
+
+    def prioritize(self, song_ids, priority=PRIORITY_VISIBLE):
+        """Move songs that haven't been fetched yet ahead in the queue (thread-safe)"""
+        with self._queue_lock:
+            for song_id in song_ids:
+                filename = self._pending.get(song_id)
+                if filename is not None:
+                    heapq.heappush(self._queue, (priority, self._sequence, song_id, filename))
+                    self._sequence += 1
+
+    def requeue(self, song_id, filename):
+        """Put a song back at the end of the normal queue to try again later in the scan"""
+        with self._queue_lock:
+            self._pending[song_id] = filename
+            heapq.heappush(self._queue, (self.PRIORITY_NORMAL, self._sequence, song_id, filename))
+            self._sequence += 1
+
+    def next_songs(self, limit):
+        """Pop up to `limit` songs that haven't been fetched yet, most urgent first.
+
+        A selected or visible song is returned on its own so it isn't held up
+        behind a batch of normal-priority songs.
+        """
+        batch = []
+        with self._queue_lock:
+            while self._queue and len(batch) < limit:
+                priority = self._queue[0][0]
+                if batch and priority < self.PRIORITY_NORMAL:
+                    break
+                _, _, song_id, filename = heapq.heappop(self._queue)
+                if self._pending.pop(song_id, None) is None:
+                    continue
+                batch.append((song_id, filename))
+                if priority < self.PRIORITY_NORMAL:
+                    break
+        return batch
+
+    def run(self):
+        songs = []
+        # Count unique IDs; duplicates in song_files collapse into one queue entry
+        total = len(self._pending)
+        done = 0
+        requeued = set()
 
+        try:
+            while batch := self.next_songs(self.resolver.BATCH_SIZE):
+                # The resolver handles the negative cache and the delay between requests
+                results = self.resolver.resolve_many(batch)
+
+                for song_id, filename in batch:
+                    metadata, failure = results.get(song_id, (None, 'network_error'))
+
+                    # Give songs hit by throttling or an outage one more go at the end of the scan
+                    if failure in NegativeCache.TRANSIENT and song_id not in requeued:
+                        requeued.add(song_id)
+                        self.requeue(song_id, filename)
+                        self.log_updated.emit(f"Will retry song ID {song_id} later in the scan")
+                        continue
+
+                    if failure:
+                        self.failures[song_id] = failure
+
+                    if metadata:
+                         songs.append(metadata)
+                         self.song_fetched.emit(metadata)
+
+                    # Update progress
+                    done += 1
+                    progress = int(done / total * 100)
+                    self.progress_updated.emit(progress)
+
+            self.resolver.save()
+            self.report_failures()
         except Exception as e:
-            self.log_updated.emit(f"Error fetching metadata for song ID {song_id}: {e}")
-            return None
+            self.log_updated.emit(f"Error while fetching metadata, stopping scan: {e}")
+        finally:
+            # Always hand back what we have so the window re-enables its buttons
+            self.finished_with_songs.emit(songs)
+
+    def report_failures(self):
+        """Log the songs that couldn't be fetched, grouped by failure class"""
+        if not self.failures:
+            return
+        self.log_updated.emit(f"Failure report: {len(self.failures)} songs did not resolve normally")
+        by_reason = {}
+        for song_id, reason in self.failures.items():
+            by_reason.setdefault(reason, []).append(song_id)
+        for reason, song_ids in by_reason.items():
+            label = NegativeCache.LABELS.get(reason, reason)
+            ids_text = ", ".join(str(song_id) for song_id in sorted(song_ids))
+            self.log_updated.emit(f"  {label} ({len(song_ids)}): {ids_text}")
+
+
+class PathDetectWorker(QThread):
+    """Worker thread for finding the Geometry Dash and Music folders"""
+    log_updated = pyqtSignal(str)
+    paths_detected = pyqtSignal(object, object)
+
+    def __init__(self, detect_gd=True, detect_music=True, parent=None):
+        super().__init__(parent)
+        self.detect_gd = detect_gd
+        self.detect_music = detect_music
+
+    def run(self):
+        # Probing Wine/Steam prefixes and running xdg-user-dir can be slow, so keep it off the GUI thread
+        gd_path = detect_gd_songs_path(self.log_updated.emit) if self.detect_gd else None
+        music_path = detect_music_folder_path(self.log_updated.emit) if self.detect_music else None
+        self.paths_detected.emit(gd_path, music_path)
+
+
+class CatalogLoadWorker(QThread):
+    """Worker thread for reading the catalog saved by the last scan"""
+    log_updated = pyqtSignal(str)
+    catalog_loaded = pyqtSignal(list)
+
+    def __init__(self, catalog_path, parent=None):
+        super().__init__(parent)
+        self.catalog_path = catalog_path
+
+    def run(self):
+        songs = load_json_file(self.catalog_path, [], self.log_updated.emit)
+        self.catalog_loaded.emit(songs if isinstance(songs, list) else [])
 
 
 class CopyWorker(QThread):
@@ -216,12 +1068,14 @@ class CopyWorker(QThread):
 
         self.log_updated.emit(f"Copying {total} songs to {self.music_path}...")
 
+        # Remember which file came from which song so tags can be refreshed later
+        manifest = load_manifest(self.music_path, self.log_updated.emit)
+
         for i, song in enumerate(self.songs_to_copy):
             source_path = self.gd_path / song['filename']
 
             # Create safe filename
-            safe_filename = f"{song['artist']} - {song['title']}.mp3"
-            safe_filename = re.sub(r'[\\/*?:"<>|]', '_', safe_filename)  # Remove illegal characters
+            safe_filename = safe_song_filename(song)
 
             destination_path = self.music_path / safe_filename
 
@@ -230,17 +1084,8 @@ class CopyWorker(QThread):
                 shutil.copy2(source_path, destination_path)
 
                 # Add metadata
-                try:
-                    audio = EasyID3(destination_path)
-                except mutagen.id3.ID3NoHeaderError:
-                    # If there's no ID3 tag, add one
-                    audio = mutagen.File(destination_path, easy=True)
-                    audio.add_tags()
-
-                audio['title'] = song['title']
-                audio['artist'] = song['artist']
-                audio['genre'] = song['genre']
-                audio.save()
+                write_song_tags(destination_path, song)
+                manifest[safe_filename] = song['id']
 
                 self.log_updated.emit(f"Copied: {song['artist']} - {song['title']}")
             except Exception as e:
@@ -253,41 +1098,165 @@ class CopyWorker(QThread):
             # Small delay
             time.sleep(0.1)
 
+        save_manifest(self.music_path, manifest, self.log_updated.emit)
+
         self.log_updated.emit(f"Successfully copied {total} songs to {self.music_path}")
         self.finished.emit()
 
 
+class RetagWorker(QThread):
+    """Worker thread for refreshing ID3 tags of already copied songs"""
+    progress_updated = pyqtSignal(int)
+    log_updated = pyqtSignal(str)
+    finished = pyqtSignal()
+
+    def __init__(self, songs, music_path, parent=None):
+        super().__init__(parent)
+        self.songs_by_id = {song['id']: song for song in songs if not song.get('pending')}
+        self.music_path = music_path
+
+        # Libraries copied before IDs were stored in the tags/manifest are matched by
+        # 'Artist - Title.mp3' filename or by their title/artist tags (only for files
+        # that look like our exports, see retag_file). Keys that more than one song
+        # would produce map to None so they are never guessed.
+        self.songs_by_filename = {}
+        self.songs_by_tags = {}
+        for song in self.songs_by_id.values():
+            for index, key in ((self.songs_by_filename, safe_song_filename(song).lower()),
+                               (self.songs_by_tags, (song['title'].lower(), song['artist'].lower()))):
+                index[key] = None if key in index else song['id']
+
+    def run(self):
+        manifest = load_manifest(self.music_path, self.log_updated.emit)
+
+        # Walk the music folder for MP3s (relative paths are the manifest keys)
+        files = []
+        for root, _, filenames in os.walk(self.music_path):
+            for filename in filenames:
+                if filename.lower().endswith('.mp3'):
+                    path = Path(root) / filename
+                    files.append((path.relative_to(self.music_path).as_posix(), path))
+
+        total = len(files)
+        if total == 0:
+            self.log_updated.emit(f"No MP3 files found in {self.music_path}")
+            self.finished.emit()
+            return
+
+        self.log_updated.emit(f"Refreshing tags for {total} files in {self.music_path}...")
+        updated = unchanged = unmatched = 0
+
+        # Tag I/O releases the GIL, so a thread pool is enough to parallelise it
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            futures = {
+                executor.submit(self.retag_file, path, manifest.get(relative_name)): relative_name
+                for relative_name, path in files
+            }
+            for i, future in enumerate(as_completed(futures)):
+                relative_name = futures[future]
+                try:
+                    song_id, changed, match = future.result()
+                except Exception as e:
+                    self.log_updated.emit(f"Error retagging {relative_name}: {e}")
+                    song_id, changed, match = None, False, None
+
+                if song_id is None:
+                    unmatched += 1
+                else:
+                    if match:
+                        self.log_updated.emit(f"Matched {relative_name} to song ID {song_id} by {match}")
+                    manifest[relative_name] = song_id
+                    if changed:
+                        updated += 1
+                        self.log_updated.emit(f"Retagged: {relative_name}")
+                    else:
+                        unchanged += 1
+
+                progress = int((i + 1) / total * 100)
+                self.progress_updated.emit(progress)
+
+        save_manifest(self.music_path, manifest, self.log_updated.emit)
+
+        self.log_updated.emit(f"Tag refresh done: {updated} updated, {unchanged} already up to date, "
+                              f"{unmatched} not matched to a scanned song")
+        self.finished.emit()
+
+    def retag_file(self, path, song_id):
+        """Match a file to a scanned song and rewrite its changed frames.
+
+        Returns (song_id, changed, match): song_id is None if the file couldn't be matched,
+        and match names the heuristic used when the ID wasn't already known.
+        """
+        match = None
+        if song_id is None:
+            song_id, title, artist, album = read_song_tags(path)
+            # Older exports never set an album. Anything with another album is the user's own
+            # music (e.g. a rip of the same track), so don't guess and overwrite its tags.
+            if song_id is None and album in (None, "Geometry Dash"):
+                song_id = self.songs_by_filename.get(path.name.lower())
+                if song_id is not None:
+                    match = "filename"
+                elif title and artist:
+                    song_id = self.songs_by_tags.get((title.lower(), artist.lower()))
+                    if song_id is not None:
+                        match = "title/artist tags"
+        # Matched files get the ID frame written, so the next refresh skips the fallbacks
+        song = self.songs_by_id.get(song_id)
+        if song is None:
+            return None, False, None
+        return song_id, write_song_tags(path, song), match
+
+
 class GeometryDashSongManager(QMainWindow):
-    def __init__(self):
+    def __init__(self, startup_time=None, server_url=None):
         super().__init__()
 
+        # Used to report how long startup took
+        self.startup_time = startup_time if startup_time is not None else time.perf_counter()
+        # Optional shared metadata server to use instead of scraping Newgrounds directly
+        self.server_url = server_url
+
         # Setup window properties
         self.setWindowTitle("GDSongExtractor v1.0.2 by MalikHw47")
         self.setMinimumSize(900, 650)
 
         # Initialize variables - Set gd_path and music_path to None initially
         self.songs = []
+        # song_id -> song dict in self.songs, for O(1) updates as metadata arrives
+        self.songs_by_id = {}
+        self.song_items = {}
+        self.fetch_worker = None
         self.gd_path = None
         self.music_path = None
+        self.parse_pool = None
+        self.path_worker = None
+        self.catalog_worker = None
 
         # Create UI FIRST
         self.init_ui()
+        self.log("GDSongExtractor v1.0.2 started")
 
-        # Now get paths AFTER UI (and log_text) exists
-        self.gd_path = self.get_gd_songs_path()
-        self.music_path = self.get_music_folder_path()
-
-        # Update labels *after* paths are determined and UI exists
-        self.gd_path_label.setText(f"Geometry Dash Folder: {self.gd_path if self.gd_path else 'Not Found'}")
-        self.music_path_label.setText(f"Music Folder: {self.music_path if self.music_path else 'Not Found'}")
+        # Cache files are set up after the UI so problems with them show in the log
+        data_dir = get_app_data_dir(self.log)
+        # Failed lookups from previous scans, so dead songs aren't re-fetched
+        self.negative_cache = NegativeCache(data_dir / "negative_cache.json" if data_dir else None, self.log)
+
+        # Paths and the last catalog are remembered between runs
+        self.settings_path = data_dir / "settings.json" if data_dir else None
+        self.catalog_path = data_dir / "catalog.json" if data_dir else None
+        if self.server_url:
+            self.log(f"Using metadata server: {self.server_url}")
+            # The server parses pages and keeps the failure cache, so the local ones go unused
+            self.multiprocess_checkbox.setChecked(False)
+            self.multiprocess_checkbox.setEnabled(False)
+            self.forget_failures_btn.setEnabled(False)
+            self.forget_failures_btn.setToolTip("Failed songs are cached by the metadata server")
+        # Scanning needs the Geometry Dash path, which is found after the window shows
+        self.scan_btn.setEnabled(False)
 
-        # Log initial status *after* UI exists
-        self.log("GDSongExtractor v1.0.2 started")
-        if not self.gd_path:
-            self.log("ERROR: Couldn't find Geometry Dash folder")
-            self.scan_btn.setEnabled(False)
-        if not self.music_path:
-            self.log("ERROR: Couldn't find default Music folder (but created one if possible)")
+        # Everything else waits until the window has been painted (see paintEvent)
+        self.startup_finished = False
+        self.catalog_rows_pending = False
 
     def init_ui(self):
         # Main layout
@@ -360,6 +1329,9 @@ class GeometryDashSongManager(QMainWindow):
         # Song list
         self.song_list = QListWidget()
         self.song_list.setSelectionMode(QListWidget.SelectionMode.MultiSelection)
+        # Fetch metadata for whatever the user is looking at first
+        self.song_list.itemSelectionChanged.connect(self.prioritize_selected_songs)
+        self.song_list.verticalScrollBar().valueChanged.connect(self.prioritize_visible_songs)
         song_list_layout.addWidget(self.song_list)
 
         # Selection buttons
@@ -396,12 +1368,29 @@ class GeometryDashSongManager(QMainWindow):
         self.copy_btn.clicked.connect(self.copy_songs)
         self.copy_btn.setEnabled(False)
 
+        self.retag_btn = QPushButton("Refresh Tags")
+        self.retag_btn.setToolTip("Rewrite tags of songs already in the Music folder using the scanned metadata")
+        self.retag_btn.clicked.connect(self.retag_songs)
+        self.retag_btn.setEnabled(False)
+
+        self.forget_failures_btn = QPushButton("Retry Failed Songs")
+        self.forget_failures_btn.setToolTip("Forget cached Newgrounds failures so the next scan fetches those songs again")
+        self.forget_failures_btn.clicked.connect(self.clear_failure_cache)
+
         donate_btn = QPushButton("Donate")
         donate_btn.clicked.connect(self.open_donation)
         donate_btn.setStyleSheet("background-color: #29abe0; color: white;")
 
+        self.multiprocess_checkbox = QCheckBox("Parse pages in a separate process")
+        self.multiprocess_checkbox.setChecked(True)
+        self.multiprocess_checkbox.setToolTip("Keeps the window responsive during large scans by parsing pages outside the GUI process")
+        self.multiprocess_checkbox.toggled.connect(self.toggle_parse_pool)
+
+        button_layout.addWidget(self.multiprocess_checkbox)
         button_layout.addWidget(self.scan_btn)
         button_layout.addWidget(self.copy_btn)
+        button_layout.addWidget(self.retag_btn)
+        button_layout.addWidget(self.forget_failures_btn)
         button_layout.addWidget(donate_btn)
 
         content_layout.addLayout(button_layout)
@@ -411,6 +1400,126 @@ class GeometryDashSongManager(QMainWindow):
         central_widget.setLayout(main_layout)
         self.setCentralWidget(central_widget)
 
+    def paintEvent(self, event):
+        """Finish startup once the first frame has been drawn"""
+        super().paintEvent(event)
+        if not self.startup_finished:
+            self.startup_finished = True
+            self.log(f"Window shown after {(time.perf_counter() - self.startup_time) * 1000:.0f} ms")
+            # Queue the rest so it runs after this paint completes
+            QTimer.singleShot(0, self.finish_startup)
+
+    def finish_startup(self):
+        """Load cached state and start background work once the window is visible"""
+        # Reuse the paths found last time if they are still there
+        settings = load_json_file(self.settings_path, {}, self.log)
+        cached_gd = Path(settings['gd_path']) if settings.get('gd_path') else None
+        cached_music = Path(settings['music_path']) if settings.get('music_path') else None
+        if cached_gd and cached_gd.exists():
+            self.gd_path = cached_gd
+        if cached_music and cached_music.exists():
+            self.music_path = cached_music
+
+        if self.gd_path and self.music_path:
+            self.paths_ready(warm=True)
+        else:
+            # Only detect what the cache couldn't provide
+            self.gd_path_label.setText(f"Geometry Dash Folder: {self.gd_path if self.gd_path else 'Detecting...'}")
+            self.music_path_label.setText(f"Music Folder: {self.music_path if self.music_path else 'Detecting...'}")
+            self.scan_btn.setEnabled(False)
+            self.path_worker = PathDetectWorker(self.gd_path is None, self.music_path is None)
+            self.path_worker.log_updated.connect(self.log)
+            self.path_worker.paths_detected.connect(self.paths_detected)
+            self.path_worker.start()
+
+        self.load_catalog()
+
+        # Start the parser processes now so they are warm by the time a scan begins
+        if self.multiprocess_checkbox.isChecked() and self.parse_pool is None and not self.server_url:
+            self.parse_pool = create_parse_pool()
+
+    def paths_detected(self, gd_path, music_path):
+        """Receive paths found by the background detection"""
+        self.gd_path = self.gd_path or gd_path
+        self.music_path = self.music_path or music_path
+        self.save_settings()
+        self.paths_ready(warm=False)
+
+    def paths_ready(self, warm):
+        """Update labels and buttons once both paths are known"""
+        self.gd_path_label.setText(f"Geometry Dash Folder: {self.gd_path if self.gd_path else 'Not Found'}")
+        self.music_path_label.setText(f"Music Folder: {self.music_path if self.music_path else 'Not Found'}")
+
+        elapsed = (time.perf_counter() - self.startup_time) * 1000
+        self.log(f"Paths ready after {elapsed:.0f} ms ({'warm start, cached' if warm else 'cold start, detected'})")
+        if not self.gd_path:
+            self.log("ERROR: Couldn't find Geometry Dash folder")
+        if not self.music_path:
+            self.log("ERROR: Couldn't find default Music folder (but created one if possible)")
+        self.scan_btn.setEnabled(True if self.gd_path else False)
+
+    def save_settings(self):
+        """Remember the current paths for the next start"""
+        save_json_file(self.settings_path, {
+            'gd_path': str(self.gd_path) if self.gd_path else None,
+            'music_path': str(self.music_path) if self.music_path else None
+        }, self.log)
+
+    def load_catalog(self):
+        """Read the songs from the last scan in the background"""
+        self.catalog_worker = CatalogLoadWorker(self.catalog_path)
+        self.catalog_worker.log_updated.connect(self.log)
+        self.catalog_worker.catalog_loaded.connect(self.show_catalog)
+        self.catalog_worker.start()
+
+    def show_catalog(self, songs):
+        """Show the loaded catalog, unless a scan has already started"""
+        if not songs or self.songs:
+            return
+        self.songs = songs
+        self.songs_by_id = {song['id']: song for song in songs}
+        self.song_list.clear()
+        self.song_items = {}
+        self.catalog_rows_pending = True
+        self.add_catalog_rows(songs, 0, time.perf_counter())
+
+    def add_catalog_rows(self, songs, start, load_start):
+        """Add catalog rows a chunk at a time so the window stays responsive"""
+        # A scan, search or other full repopulation has replaced the list since
+        if not self.catalog_rows_pending or self.songs is not songs:
+            return
+
+        chunk_size = 500
+        self.append_song_items(songs[start:start + chunk_size])
+        if start + chunk_size < len(songs):
+            QTimer.singleShot(0, lambda: self.add_catalog_rows(songs, start + chunk_size, load_start))
+            return
+
+        self.catalog_rows_pending = False
+        self.copy_btn.setEnabled(True)
+        self.retag_btn.setEnabled(True)
+        elapsed = (time.perf_counter() - self.startup_time) * 1000
+        self.log(f"Loaded {len(songs)} songs from the last scan after {elapsed:.0f} ms "
+                 f"({(time.perf_counter() - load_start) * 1000:.0f} ms to fill the list, scan again to refresh)")
+
+    def toggle_parse_pool(self, enabled):
+        """Start or stop the HTML parsing process pool"""
+        if enabled and self.parse_pool is None:
+            self.parse_pool = create_parse_pool()
+            self.log("Background parsing process enabled")
+        elif not enabled and self.parse_pool is not None:
+            # A running scan keeps its reference, so let queued jobs finish
+            self.parse_pool.shutdown(wait=False)
+            self.parse_pool = None
+            self.log("Background parsing process disabled")
+
+    def closeEvent(self, event):
+        """Shut down the parse pool when the window closes"""
+        if self.parse_pool is not None:
+            self.parse_pool.shutdown(wait=False, cancel_futures=True)
+            self.parse_pool = None
+        super().closeEvent(event)
+
     def log(self, message):
         """Add a message to the log"""
         # Check if log_text exists before trying to append
@@ -423,151 +1532,6 @@ class GeometryDashSongManager(QMainWindow):
              # Fallback if log is called too early (shouldn't happen now, but safe)
              print(f"LOG (early): {message}")
 
-    def get_gd_songs_path(self):
-        """Get the path to Geometry Dash songs folder based on OS"""
-        gd_path = None
-        try:
-            if platform.system() == "Windows":
-                 username = os.environ.get('USERNAME') or os.environ.get('USER')
-                 # Use LOCALAPPDATA environment variable for robustness
-                 local_app_data = os.environ.get('LOCALAPPDATA')
-                 if local_app_data:
-                     gd_path = Path(local_app_data) / "GeometryDash"
-                 elif username: # Fallback to constructed path
-                     gd_path = Path(f"C:/Users/{username}/AppData/Local/GeometryDash")
-
-            elif platform.system() == "Linux":
-                username = os.environ.get('USER')
-                # Common Wine path, check if ~/.wine exists first
-                wine_path = Path.home() / ".wine" # Use Path.home()
-                if wine_path.exists() and username:
-                    # Check for potential Proton path first if Steam directory exists
-                    steam_path = Path.home() / ".steam" / "steam" / "steamapps" / "compatdata" / "322170" / "pfx"
-                    proton_gd_path = None
-                    if steam_path.exists():
-                         # Standard Proton user might be steamuser
-                         steam_user_path = steam_path / "drive_c" / "users" / "steamuser" / "AppData" / "Local" / "GeometryDash"
-                         if steam_user_path.exists():
-                              proton_gd_path = steam_user_path
-                         else:
-                              # Fallback to current username within proton prefix (less common)
-                              user_proton_path = steam_path / "drive_c" / "users" / username / "AppData" / "Local" / "GeometryDash"
-                              if user_proton_path.exists():
-                                   proton_gd_path = user_proton_path
-
-                    if proton_gd_path:
-                         gd_path = proton_gd_path
-                         self.log("Detected Steam Play (Proton) Geometry Dash path.")
-                    else:
-                        # Fallback to standard Wine path
-                        wine_gd_path = wine_path / f"drive_c/users/{username}/AppData/Local/GeometryDash"
-                        if wine_gd_path.exists():
-                             gd_path = wine_gd_path
-                             self.log("Detected standard Wine Geometry Dash path.")
-
-            elif platform.system() == "Darwin": # macOS
-                 username = os.environ.get('USER')
-                 if username:
-                     # Default path for GD on macOS
-                     mac_path = Path.home() / "Library" / "Application Support" / "GeometryDash"
-                     if mac_path.exists():
-                          gd_path = mac_path
-
-            else:
-                self.log(f"Unsupported operating system: {platform.system()}")
-                return None
-
-            if gd_path and not gd_path.exists():
-                 self.log(f"Potential Geometry Dash path found but does not exist: {gd_path}")
-                 return None
-            elif not gd_path:
-                 self.log("Could not determine Geometry Dash path.")
-                 return None
-
-        except Exception as e:
-            self.log(f"Error determining Geometry Dash path: {e}")
-            return None
-
-        self.log(f"Found Geometry Dash path: {gd_path}")
-        return gd_path
-
-    def get_music_folder_path(self):
-        """Get the path to the user's Music folder"""
-        music_path = None
-        try:
-            if platform.system() == "Windows":
-                # Use SHGetKnownFolderPath for robustness (requires ctypes/comtypes, fallback if unavailable)
-                try:
-                    import ctypes
-                    from ctypes import wintypes, windll
-
-                    FOLDERID_Music = ctypes.GUID('{4BD8D571-6D19-48D3-BE97-422220080E43}')
-                    SHGetKnownFolderPath = windll.shell32.SHGetKnownFolderPath
-                    SHGetKnownFolderPath.argtypes = [
-                        ctypes.POINTER(ctypes.GUID), wintypes.DWORD,
-                        wintypes.HANDLE, ctypes.POINTER(wintypes.LPWSTR)
-                    ]
-                    SHGetKnownFolderPath.restype = ctypes.HRESULT
-
-                    path_ptr = wintypes.LPWSTR()
-                    if SHGetKnownFolderPath(ctypes.byref(FOLDERID_Music), 0, None, ctypes.byref(path_ptr)) == 0: # S_OK
-                         music_path = Path(path_ptr.value)
-                         ctypes.windll.ole32.CoTaskMemFree(path_ptr) # Free memory
-                    else: # Fallback if API call fails
-                         raise OSError("SHGetKnownFolderPath failed")
-
-                except Exception:
-                     # Fallback if ctypes fails or on minimal systems
-                     username = os.environ.get('USERNAME') or os.environ.get('USER')
-                     if username:
-                        user_profile = os.environ.get('USERPROFILE')
-                        if user_profile:
-                             music_path = Path(user_profile) / "Music"
-                        else: # Absolute fallback
-                             music_path = Path(f"C:/Users/{username}/Music")
-
-            elif platform.system() == "Linux":
-                username = os.environ.get('USER')
-                if username:
-                     # Check XDG user directory config first
-                     try:
-                         # Use subprocess to call xdg-user-dir for reliability
-                         result = subprocess.run(['xdg-user-dir', 'MUSIC'], capture_output=True, text=True, check=True)
-                         xdg_music_dir = result.stdout.strip()
-                         if xdg_music_dir and Path(xdg_music_dir).is_dir():
-                             music_path = Path(xdg_music_dir)
-                         else: # Fallback to default if xdg-user-dir gives bad path or isn't set
-                             music_path = Path.home() / "Music"
-                     except (FileNotFoundError, subprocess.CalledProcessError): # If xdg-user-dir command fails
-                         music_path = Path.home() / "Music"
-
-            elif platform.system() == "Darwin": # macOS
-                music_path = Path.home() / "Music"
-
-            else:
-                 self.log(f"Cannot determine Music folder for OS: {platform.system()}")
-                 return None
-
-            # Create the directory if it doesn't exist and we found a path
-            if music_path and not music_path.exists():
-                try:
-                    music_path.mkdir(parents=True, exist_ok=True)
-                    self.log(f"Created Music folder: {music_path}")
-                except Exception as e:
-                     self.log(f"Error creating Music folder {music_path}: {e}")
-                     return None # Failed to create
-
-        except Exception as e:
-             self.log(f"Error determining Music folder path: {e}")
-             return None
-
-        if music_path:
-             self.log(f"Using Music folder: {music_path}")
-        else:
-             self.log("Could not determine Music folder path.")
-
-        return music_path
-
     def change_music_folder(self):
         """Open dialog to change music folder destination"""
         # Start Browse from the current music path if it exists, otherwise home dir
@@ -580,6 +1544,7 @@ class GeometryDashSongManager(QMainWindow):
                  self.music_path = new_path
                  self.music_path_label.setText(f"Music Folder: {self.music_path}")
                  self.log(f"Music folder changed to: {self.music_path}")
+                 self.save_settings()
             else:
                  self.log(f"ERROR: Cannot write to selected folder: {new_path}")
                  # Optionally show a message box to the user here using QMessageBox
@@ -594,7 +1559,9 @@ class GeometryDashSongManager(QMainWindow):
         self.progress_bar.setValue(0)
         self.song_list.clear()
         self.songs = []
+        self.songs_by_id = {}
         self.copy_btn.setEnabled(False)
+        self.retag_btn.setEnabled(False)
         self.search_input.clear()
 
         # Get song files
@@ -611,16 +1578,34 @@ class GeometryDashSongManager(QMainWindow):
         # Disable scan button during operation
         self.scan_btn.setEnabled(False)
 
+        # Show placeholder rows right away; they fill in as metadata arrives
+        self.songs = [
+            {
+                'id': song_id,
+                'title': f"Song {song_id}",
+                'artist': "Unknown Artist",
+                'genre': "",
+                'filename': filename,
+                'url': f"https://www.newgrounds.com/audio/listen/{song_id}",
+                'pending': True
+            }
+            for song_id, filename in song_files
+        ]
+        self.songs_by_id = {song['id']: song for song in self.songs}
+        self.populate_song_list(self.songs)
+
         # Start fetch worker
-        self.fetch_worker = FetchWorker(song_files)
+        self.fetch_worker = FetchWorker(song_files, self.parse_pool, self.negative_cache, self.server_url)
         self.fetch_worker.progress_updated.connect(self.progress_bar.setValue)
         self.fetch_worker.log_updated.connect(self.log)
+        self.fetch_worker.song_fetched.connect(self.update_song)
         self.fetch_worker.finished_with_songs.connect(self.update_song_list)
         self.fetch_worker.start()
 
     def get_song_files(self):
         """Get all MP3 files from Geometry Dash folder, filtering out specified patterns"""
         song_files = []
+        seen_ids = set()
         if not self.gd_path or not self.gd_path.exists():
              self.log("Geometry Dash path is invalid, cannot get song files.")
              return song_files
@@ -638,6 +1623,11 @@ class GeometryDashSongManager(QMainWindow):
                          # Ensure it's purely numeric before converting
                          if song_id_str.isdigit():
                              song_id = int(song_id_str)
+                             # 1260.mp3 and 1260.bak.mp3 are the same song, keep the first one
+                             if song_id in seen_ids:
+                                 self.log(f"Skipping {file} - another file already uses song ID {song_id}")
+                                 continue
+                             seen_ids.add(song_id)
                              song_files.append((song_id, file))
                          else:
                               self.log(f"Skipping {file} - filename does not start with a numeric ID")
@@ -654,33 +1644,103 @@ class GeometryDashSongManager(QMainWindow):
         return song_files
 
     def update_song_list(self, songs):
-        """Update the song list with fetched songs"""
+        """Finish a scan: drop rows that failed and sort the rest, keeping the selection and search"""
         # Sort songs alphabetically by artist, then title
         self.songs = sorted(songs, key=lambda s: (s['artist'].lower(), s['title'].lower()))
+        self.songs_by_id = {song['id']: song for song in self.songs}
 
         if not self.songs: # Check after sorting
+            # Nothing resolved, so every remaining row is a stale placeholder
+            self.song_list.clear()
+            self.song_items = {}
             self.log("No songs found or all metadata fetches failed.")
             self.scan_btn.setEnabled(True if self.gd_path else False) # Re-enable scan button if GD path valid
             return
 
-        # Populate song list
-        self.populate_song_list(self.songs) # Use the sorted list
+        # Take the existing rows out and put back only the ones that resolved, in sorted order.
+        # Rows hidden by the current search aren't in the widget, so the filter stays applied.
+        selected_ids = {item.data(Qt.ItemDataRole.UserRole)['id'] for item in self.song_list.selectedItems()}
+        items = {}
+        while self.song_list.count():
+            item = self.song_list.takeItem(0)
+            items[item.data(Qt.ItemDataRole.UserRole)['id']] = item
+
+        self.song_items = {}
+        for song in self.songs:
+            item = items.get(song['id'])
+            if item is None:
+                continue
+            self.update_song_item(item, song)
+            self.song_list.addItem(item)
+            item.setSelected(song['id'] in selected_ids)
+            self.song_items[song['id']] = item
 
         self.log(f"Found and sorted {len(self.songs)} songs with metadata.")
+        save_json_file(self.catalog_path, self.songs, self.log)
         self.copy_btn.setEnabled(True)
+        self.retag_btn.setEnabled(True)
         self.scan_btn.setEnabled(True if self.gd_path else False) # Re-enable scan button if GD path valid
 
     def populate_song_list(self, songs):
         """Populate the song list widget with the given songs"""
+        self.catalog_rows_pending = False
         self.song_list.clear()
+        self.song_items = {}
+        self.append_song_items(songs)
 
+    def append_song_items(self, songs):
+        """Add list rows for the given songs"""
         for song in songs:
-            item = QListWidgetItem(f"{song['artist']} - {song['title']}")
-            item.setData(Qt.ItemDataRole.UserRole, song)
-            # Add tooltip with more info
-            tooltip_text = f"ID: {song['id']}\nGenre: {song['genre']}\nFilename: {song['filename']}"
-            item.setToolTip(tooltip_text)
+            item = QListWidgetItem()
+            self.update_song_item(item, song)
             self.song_list.addItem(item)
+            self.song_items[song['id']] = item
+
+    def update_song_item(self, item, song):
+        """Set a list item's text, data and tooltip from a song"""
+        if song.get('pending'):
+            item.setText(f"[{song['id']}] {song['filename']} (fetching...)")
+        else:
+            item.setText(f"{song['artist']} - {song['title']}")
+        item.setData(Qt.ItemDataRole.UserRole, song)
+        # Add tooltip with more info
+        tooltip_text = f"ID: {song['id']}\nGenre: {song['genre']}\nFilename: {song['filename']}"
+        item.setToolTip(tooltip_text)
+
+    def update_song(self, metadata):
+        """Fill in a placeholder row as soon as its metadata arrives"""
+        song = self.songs_by_id.get(metadata['id'])
+        if song is None:
+            return
+        song.update(metadata)
+        song.pop('pending', None)
+        item = self.song_items.get(song['id'])
+        if item is not None:
+            self.update_song_item(item, song)
+
+    def prioritize_songs(self, song_ids, priority=FetchWorker.PRIORITY_VISIBLE):
+        """Ask a running fetch to handle these songs next"""
+        if self.fetch_worker is not None and self.fetch_worker.isRunning():
+            self.fetch_worker.prioritize(song_ids, priority)
+
+    def prioritize_selected_songs(self):
+        """Fetch selected songs before anything else"""
+        song_ids = [item.data(Qt.ItemDataRole.UserRole)['id'] for item in self.song_list.selectedItems()]
+        self.prioritize_songs(song_ids, FetchWorker.PRIORITY_SELECTED)
+
+    def prioritize_visible_songs(self):
+        """Fetch the rows currently scrolled into view next"""
+        if self.song_list.count() == 0:
+            return
+        viewport = self.song_list.viewport()
+        first = self.song_list.indexAt(QPoint(0, 0)).row()
+        last = self.song_list.indexAt(QPoint(0, viewport.height() - 1)).row()
+        first = max(first, 0)
+        if last < 0:
+            last = self.song_list.count() - 1
+        song_ids = [self.song_list.item(row).data(Qt.ItemDataRole.UserRole)['id']
+                    for row in range(first, last + 1)]
+        self.prioritize_songs(song_ids)
 
     def filter_songs(self):
         """Filter songs based on search input"""
@@ -691,13 +1751,17 @@ class GeometryDashSongManager(QMainWindow):
             self.populate_song_list(self.songs)
             return
 
-        # Filter songs where title or artist contains the search text
+        # Filter songs where title or artist contains the search text (or the ID/filename,
+        # so songs still waiting for metadata can be found)
         filtered_songs = [
             song for song in self.songs
             if search_text in song['title'].lower() or search_text in song['artist'].lower()
+            or search_text in str(song['id']) or search_text in song['filename'].lower()
         ]
 
         self.populate_song_list(filtered_songs)
+        # Searched-for songs jump ahead of the rest of the scan
+        self.prioritize_songs([song['id'] for song in filtered_songs])
         self.log(f"Found {len(filtered_songs)} songs matching '{search_text}'")
 
     def clear_search(self):
@@ -736,6 +1800,7 @@ class GeometryDashSongManager(QMainWindow):
         # Disable buttons during operation
         self.scan_btn.setEnabled(False)
         self.copy_btn.setEnabled(False)
+        self.retag_btn.setEnabled(False)
         self.progress_bar.setValue(0)
 
         # Start copy worker
@@ -750,6 +1815,35 @@ class GeometryDashSongManager(QMainWindow):
         # Re-enable buttons, checking path validity
         self.scan_btn.setEnabled(True if self.gd_path else False)
         self.copy_btn.setEnabled(True if self.songs else False) # Only enable copy if there are songs loaded
+        self.retag_btn.setEnabled(True if self.songs else False)
+
+    def retag_songs(self):
+        """Refresh tags of songs already copied to the Music folder"""
+        if not self.music_path or not self.music_path.exists():
+            self.log("ERROR: Music path not set. Cannot refresh tags.")
+            return
+        if not self.songs:
+            self.log("No scanned songs to take metadata from. Please scan first.")
+            return
+
+        # Disable buttons during operation
+        self.scan_btn.setEnabled(False)
+        self.copy_btn.setEnabled(False)
+        self.retag_btn.setEnabled(False)
+        self.progress_bar.setValue(0)
+
+        # Start retag worker (re-enables buttons the same way a copy does)
+        self.retag_worker = RetagWorker(self.songs, self.music_path)
+        self.retag_worker.progress_updated.connect(self.progress_bar.setValue)
+        self.retag_worker.log_updated.connect(self.log)
+        self.retag_worker.finished.connect(self.copy_finished)
+        self.retag_worker.start()
+
+    def clear_failure_cache(self):
+        """Forget cached failures so the next scan retries every song"""
+        count = len(self.negative_cache.entries)
+        self.negative_cache.clear()
+        self.log(f"Cleared {count} cached song failures. They will be fetched again on the next scan.")
 
     def open_donation(self):
         """Open donation page"""
@@ -757,9 +1851,67 @@ class GeometryDashSongManager(QMainWindow):
         webbrowser.open("https://ko-fi.com/MalikHw47")
 
 
+def parse_args(argv):
+    """Parse command line options, leaving anything else for Qt"""
+    parser = argparse.ArgumentParser(description="Extract and tag Geometry Dash custom songs")
+    parser.add_argument('--server', metavar='URL', default=os.environ.get('GDSONGEXTRACTOR_SERVER'),
+                        help="use a running metadata server (e.g. http://127.0.0.1:8765) instead of scraping Newgrounds")
+    parser.add_argument('--serve', action='store_true',
+                        help="run a metadata server for other machines/profiles instead of the GUI")
+    parser.add_argument('--host', default='127.0.0.1', help="address for --serve to listen on")
+    parser.add_argument('--port', type=int, default=8765, help="port for --serve to listen on")
+    parser.add_argument('--lookup', metavar='ID', type=int, nargs='+',
+                        help="print metadata for song IDs as JSON and exit")
+    return parser.parse_known_args(argv)
+
+
+def run_server(host, port):
+    """Serve shared metadata lookups over HTTP until interrupted"""
+    data_dir = get_app_data_dir()
+    parse_pool = create_parse_pool()
+    negative_cache = NegativeCache(data_dir / "negative_cache.json" if data_dir else None)
+    server = MetadataServer(NewgroundsResolver(parse_pool, negative_cache),
+                            data_dir / "server_cache.json" if data_dir else None)
+    try:
+        server.serve(host, port)
+    finally:
+        parse_pool.shutdown(cancel_futures=True)
+
+
+def run_lookup(song_ids, server_url=None):
+    """Print metadata for song IDs as JSON, through a server if one is given"""
+    song_files = [(song_id, f"{song_id}.mp3") for song_id in song_ids]
+    log = lambda message: print(message, file=sys.stderr)
+    if server_url:
+        resolver = RemoteResolver(server_url, log)
+    else:
+        data_dir = get_app_data_dir(log)
+        resolver = NewgroundsResolver(None, NegativeCache(data_dir / "negative_cache.json" if data_dir else None, log), log)
+    results = resolver.resolve_many(song_files)
+    resolver.save()
+
+    output = {'songs': {}, 'failures': {}}
+    for song_id, (metadata, failure) in results.items():
+        if metadata:
+            output['songs'][str(song_id)] = metadata
+        if failure:
+            output['failures'][str(song_id)] = failure
+    print(json.dumps(output, indent=2))
+
+
 def main():
-    # Required for xdg-user-dir call on Linux
-    import subprocess
+    startup_time = time.perf_counter()
+
+    # Required for the parse pool in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
+
+    args, qt_args = parse_args(sys.argv[1:])
+    if args.serve:
+        run_server(args.host, args.port)
+        return
+    if args.lookup:
+        run_lookup(args.lookup, args.server)
+        return
 
     # Set High DPI scaling based on Qt version recommendations
     if hasattr(Qt.ApplicationAttribute, 'AA_EnableHighDpiScaling'):
@@ -767,15 +1919,13 @@ def main():
     if hasattr(Qt.ApplicationAttribute, 'AA_UseHighDpiPixmaps'):
         QApplication.setAttribute(Qt.ApplicationAttribute.AA_UseHighDpiPixmaps, True)
 
-    app = QApplication(sys.argv)
+    app = QApplication(sys.argv[:1] + qt_args)
     # Apply a style if desired (optional)
     # app.setStyle('Fusion')
-    window = GeometryDashSongManager()
+    window = GeometryDashSongManager(startup_time, args.server)
     window.show()
     sys.exit(app.exec())
 
 
 if __name__ == "__main__":
-    # Add import subprocess inside main or globally if used elsewhere
-    import subprocess # Added import here for get_music_folder_path
     main()